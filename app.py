@@ -5,7 +5,8 @@ A multi-agent system that validates startup ideas through deep market research,
 competitor analysis, and autonomous pivoting for non-viable ideas.
 """
 
-import asyncio
+import queue
+
 import streamlit as st
 
 from src.db.connection import init_db
@@ -13,11 +14,14 @@ from src.runner import create_and_run_job
 from src.ui import (
     ensure_db_session,
     format_timestamp,
-    get_job_details,
+    get_job_details_cached,
     get_or_create_session_token,
-    get_session_jobs,
+    get_session_jobs_cached,
+    render_job_history,
     render_status_badge,
     render_thought_trace,
+    run_async,
+    submit_async,
 )
 
 # Page configuration
@@ -50,15 +54,6 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-def run_async(coro):
-    """Run an async coroutine in Streamlit"""
-    # Reset DB engine to avoid event loop conflicts
-    from src.db.connection import _reset_engine
-    _reset_engine()
-    
-    return asyncio.run(coro)
-
-
 def main():
     """Main Streamlit application"""
     
@@ -75,24 +70,7 @@ def main():
     with st.sidebar:
         st.markdown("## 📜 Analysis History")
         
-        # Fetch past jobs
-        jobs = run_async(get_session_jobs(session_token))
-        
-        if not jobs:
-            st.info("No previous analyses. Submit your first idea!")
-        else:
-            for job in jobs:
-                col1, col2 = st.columns([3, 1])
-                with col1:
-                    if st.button(
-                        f"{job['original_idea'][:30]}...",
-                        key=f"job_{job['id']}",
-                        use_container_width=True,
-                    ):
-                        st.session_state.selected_job_id = job["id"]
-                        st.session_state.show_results = True
-                with col2:
-                    st.markdown(render_status_badge(job["status"]))
+        render_job_history(session_token)
         
         st.markdown("---")
         st.markdown(f"Session: `{session_token[:8]}...`")
@@ -107,7 +85,7 @@ def main():
     # Check if viewing a specific job
     if st.session_state.get("show_results") and st.session_state.get("selected_job_id"):
         job_id = st.session_state.selected_job_id
-        job_details = run_async(get_job_details(job_id))
+        job_details = get_job_details_cached(job_id)
         
         if job_details:
             # Back button
@@ -142,6 +120,10 @@ def main():
                 st.info("Analysis in progress... Refresh to see updates.")
             elif job_details["status"] == "pending":
                 st.info("Analysis queued...")
+            
+            # Full record (including step states) only on request
+            if st.toggle("Show raw job data"):
+                st.json(get_job_details_cached(job_id, full=True), expanded=False)
         else:
             st.error("Job not found")
             st.session_state.show_results = False
@@ -164,6 +146,7 @@ def main():
         if submitted and idea.strip():
             # Ensure we have a DB session
             session_id = run_async(ensure_db_session(session_token))
+            st.session_state.has_jobs = True
             
             # Progress display
             progress_container = st.empty()
@@ -172,12 +155,26 @@ def main():
             def update_progress(message: str):
                 status_text.markdown(f"**Status:** {message}")
             
+            # The job runs on the shared event loop thread, which has no
+            # Streamlit script context, so progress is relayed through a queue
+            progress_queue: queue.SimpleQueue[str] = queue.SimpleQueue()
+            
             with st.spinner("Running autonomous market analysis..."):
-                result = run_async(create_and_run_job(
+                future = submit_async(create_and_run_job(
                     session_id=session_id,
                     idea=idea.strip(),
-                    progress_callback=update_progress,
+                    progress_callback=progress_queue.put,
                 ))
+                while not future.done() or not progress_queue.empty():
+                    try:
+                        update_progress(progress_queue.get(timeout=0.2))
+                    except queue.Empty:
+                        pass
+                result = future.result()
+            
+            # New job row - refresh the cached history list and details
+            get_session_jobs_cached.clear()
+            get_job_details_cached.clear()
             
             if result["status"] == "completed":
                 st.success("✅ Analysis complete!")
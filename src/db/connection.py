@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from src.config import get_settings
 
@@ -60,9 +61,10 @@ def get_engine() -> AsyncEngine:
         _engine = create_async_engine(
             db_url,
             echo=False,
+            poolclass=AsyncAdaptedQueuePool,
             pool_size=5,
             max_overflow=10,
-            pool_pre_ping=False,  # Disable pre-ping to avoid loop issues
+            pool_pre_ping=True,  # Neon drops idle connections between reruns
             connect_args={
                 "ssl": "require",  # Enable SSL for Neon
             },
@@ -72,11 +74,13 @@ def get_engine() -> AsyncEngine:
 
 
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
-    """Get the async session factory"""
+    """Get the async session factory bound to the shared engine"""
     global _session_factory
-    if _session_factory is None:
+    engine = get_engine()
+    # Rebuild if get_engine() replaced the engine after an event loop change
+    if _session_factory is None or _session_factory.kw["bind"] is not engine:
         _session_factory = async_sessionmaker(
-            bind=get_engine(),
+            bind=engine,
             class_=AsyncSession,
             expire_on_commit=False,
         )
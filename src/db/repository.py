@@ -4,9 +4,9 @@ import uuid
 from datetime import datetime, timezone
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import RowMapping, case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, selectinload
 
 from src.db.models import Job, JobStatus, JobStep, PivotHistory, Session
 
@@ -61,7 +61,13 @@ class JobRepository:
         return job
     
     async def get_by_id(self, job_id: uuid.UUID) -> Job | None:
-        """Get job by ID with all relationships loaded"""
+        """Get job by ID"""
+        stmt = select(Job).where(Job.id == job_id)
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+    
+    async def get_with_children(self, job_id: uuid.UUID) -> Job | None:
+        """Get job by ID with steps and pivot history eagerly loaded"""
         stmt = (
             select(Job)
             .where(Job.id == job_id)
@@ -73,6 +79,38 @@ class JobRepository:
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
     
+    async def get_with_children_lite(self, job_id: uuid.UUID) -> Job | None:
+        """
+        Get job by ID with only the columns the results view renders.
+        
+        Step input states and other unused columns stay in the database;
+        accessing them on the returned objects is not supported.
+        """
+        stmt = (
+            select(Job)
+            .where(Job.id == job_id)
+            .options(
+                load_only(
+                    Job.original_idea,
+                    Job.status,
+                    Job.pivot_attempts,
+                    Job.final_report,
+                    Job.error_message,
+                ),
+                selectinload(Job.steps).load_only(
+                    JobStep.node_name,
+                    JobStep.pivot_attempt,
+                    JobStep.duration_ms,
+                    JobStep.error,
+                    JobStep.timestamp,
+                    JobStep.output_state,
+                ),
+                selectinload(Job.pivot_history),
+            )
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+    
     async def get_by_session(
         self, 
         session_id: uuid.UUID,
@@ -88,6 +126,42 @@ class JobRepository:
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
     
+    async def list_summaries(
+        self, 
+        session_token: str,
+        limit: int = 20
+    ) -> list[RowMapping]:
+        """
+        Get lightweight job summaries for a session token, most recent first.
+        
+        Only the columns the history list needs are selected, and the idea
+        text is truncated (with an ellipsis) in SQL, so no ORM objects, report
+        bodies or long pitches are shipped from the database.
+        """
+        stmt = (
+            select(
+                Job.id,
+                case(
+                    (
+                        func.char_length(Job.original_idea) > 50,
+                        func.substr(Job.original_idea, 1, 50) + "...",
+                    ),
+                    else_=Job.original_idea,
+                ).label("original_idea"),
+                Job.status,
+                Job.pivot_attempts,
+                Job.created_at,
+                Job.completed_at,
+                Job.final_report.is_not(None).label("has_report"),
+            )
+            .join(Session, Job.session_id == Session.id)
+            .where(Session.session_token == session_token)
+            .order_by(Job.created_at.desc())
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return list(result.mappings().all())
+    
     async def update_status(
         self, 
         job_id: uuid.UUID, 
@@ -1,7 +1,17 @@
-"""Streamlit UI components and helpers"""
+"""
+Streamlit UI components and helpers
+
+DB helpers open short-lived sessions via ``get_session()``; these all draw
+from the single pooled engine in ``src.db.connection`` (pool_size=5,
+max_overflow=10), so no helper creates its own engine or connection.
+Coroutines run on one process-wide event loop (see ``run_async``) so that
+engine and its pool survive across reruns and browser sessions.
+"""
 
 import asyncio
+import threading
 import uuid
+from concurrent.futures import Future
 from datetime import datetime
 from typing import Any
 
@@ -9,7 +19,63 @@ import streamlit as st
 
 from src.db.connection import get_session, init_db
 from src.db.models import JobStatus
-from src.db.repository import JobRepository, PivotHistoryRepository, SessionRepository
+from src.db.repository import JobRepository, SessionRepository
+
+
+_NODE_ICONS = {
+    "input_validator": "🛡️",
+    "market_researcher": "🔍",
+    "competitor_analyst": "📊",
+    "debate_panel": "⚔️",
+    "devils_advocate": "😈",
+    "apply_pivot": "🔄",
+    "writer": "✍️",
+    "handle_invalid": "⚠️",
+}
+
+_STATUS_COLORS = {
+    "pending": "🟡",
+    "running": "🔵",
+    "validating": "🛡️",
+    "validated": "✅",
+    "invalid_input": "⚠️",
+    "researching": "🔍",
+    "debating": "⚔️",
+    "writing": "✍️",
+    "completed": "🟢",
+    "failed": "🔴",
+}
+
+_SPEAKER_ICONS = {"Bull": "🐂", "Bear": "🐻", "Synthesizer": "⚖️"}
+
+
+@st.cache_resource(show_spinner=False)
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the process-wide event loop that owns the DB engine.
+    
+    asyncpg connections are bound to the loop that opened them, so running
+    each call under a fresh ``asyncio.run`` loop forced an engine rebuild per
+    call. Keeping one loop alive in a daemon thread lets the pool persist.
+    """
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(
+        target=loop.run_forever,
+        name="vcscout-event-loop",
+        daemon=True,
+    )
+    thread.start()
+    return loop
+
+
+def submit_async(coro) -> Future:
+    """Schedule a coroutine on the shared event loop without waiting"""
+    return asyncio.run_coroutine_threadsafe(coro, _get_event_loop())
+
+
+def run_async(coro):
+    """Run an async coroutine in Streamlit and wait for its result"""
+    return submit_async(coro).result()
 
 
 def get_or_create_session_token() -> str:
@@ -27,44 +93,87 @@ async def ensure_db_session(session_token: str) -> uuid.UUID:
         return session.id
 
 
-async def get_session_jobs(session_token: str) -> list[dict[str, Any]]:
+async def _fetch_session_jobs(session_token: str) -> list[dict[str, Any]]:
     """Get all jobs for the current session"""
     async with get_session() as db:
-        session_repo = SessionRepository(db)
-        session = await session_repo.get_by_token(session_token)
-        
-        if not session:
-            return []
-        
         job_repo = JobRepository(db)
-        jobs = await job_repo.get_by_session(session.id)
+        jobs = await job_repo.list_summaries(session_token)
         
         return [
             {
-                "id": str(job.id),
-                "original_idea": job.original_idea[:50] + "..." if len(job.original_idea) > 50 else job.original_idea,
-                "status": job.status.value,
-                "pivot_attempts": job.pivot_attempts,
-                "created_at": job.created_at,
-                "completed_at": job.completed_at,
-                "has_report": job.final_report is not None,
+                "id": str(job["id"]),
+                "original_idea": job["original_idea"],
+                "status": job["status"].value,
+                "pivot_attempts": job["pivot_attempts"],
+                "created_at": job["created_at"],
+                "completed_at": job["completed_at"],
+                "has_report": job["has_report"],
             }
             for job in jobs
         ]
 
 
+@st.cache_data(ttl=30, show_spinner=False)
+def get_session_jobs_cached(session_token: str) -> list[dict[str, Any]]:
+    """
+    Get all jobs for the current session, cached across reruns.
+    
+    Widget interactions rerun the whole script, so the jobs list is served
+    from cache and only re-queried after the TTL expires or an explicit
+    ``get_session_jobs_cached.clear()`` (e.g. after a job is submitted).
+    """
+    return run_async(_fetch_session_jobs(session_token))
+
+
+async def get_job_details_lite(job_id: str) -> dict[str, Any] | None:
+    """Get the job fields, steps and pivot history the results view renders"""
+    async with get_session() as db:
+        job_repo = JobRepository(db)
+        job = await job_repo.get_with_children_lite(uuid.UUID(job_id))
+        
+        if not job:
+            return None
+        
+        return {
+            "id": str(job.id),
+            "original_idea": job.original_idea,
+            "status": job.status.value,
+            "pivot_attempts": job.pivot_attempts,
+            "final_report": job.final_report,
+            "error_message": job.error_message,
+            "steps": [
+                {
+                    "node_name": step.node_name,
+                    "pivot_attempt": step.pivot_attempt,
+                    "duration_ms": step.duration_ms,
+                    "error": step.error,
+                    "timestamp": step.timestamp,
+                    "output_state": step.output_state,
+                }
+                for step in job.steps
+            ],
+            "pivot_history": [
+                {
+                    "attempt_num": pivot.attempt_num,
+                    "original_idea": pivot.original_idea,
+                    "suggested_pivot": pivot.suggested_pivot,
+                    "reason": pivot.reason,
+                    "score": pivot.score,
+                }
+                for pivot in job.pivot_history
+            ],
+        }
+
+
 async def get_job_details(job_id: str) -> dict[str, Any] | None:
     """Get full job details including steps and pivot history"""
     async with get_session() as db:
         job_repo = JobRepository(db)
-        job = await job_repo.get_by_id(uuid.UUID(job_id))
+        job = await job_repo.get_with_children(uuid.UUID(job_id))
         
         if not job:
             return None
         
-        pivot_repo = PivotHistoryRepository(db)
-        pivots = await pivot_repo.get_by_job(job.id)
-        
         return {
             "id": str(job.id),
             "original_idea": job.original_idea,
@@ -82,6 +191,8 @@ async def get_job_details(job_id: str) -> dict[str, Any] | None:
                     "duration_ms": step.duration_ms,
                     "error": step.error,
                     "timestamp": step.timestamp,
+                    "input_state": step.input_state,
+                    "output_state": step.output_state,
                 }
                 for step in job.steps
             ],
@@ -94,11 +205,58 @@ async def get_job_details(job_id: str) -> dict[str, Any] | None:
                     "score": pivot.score,
                     "timestamp": pivot.timestamp,
                 }
-                for pivot in pivots
+                for pivot in job.pivot_history
             ],
         }
 
 
+@st.cache_data(ttl=5, show_spinner=False)
+def get_job_details_cached(job_id: str, full: bool = False) -> dict[str, Any] | None:
+    """
+    Get job details, cached briefly across reruns.
+    
+    Returns the lite view used by the results page unless ``full`` is set,
+    which also loads every column including step input/output states. The
+    short TTL keeps in-progress jobs fresh while making reruns on the same
+    job (expanders, buttons) skip the DB. Call
+    ``get_job_details_cached.clear()`` after a job changes status.
+    """
+    if full:
+        return run_async(get_job_details(job_id))
+    return run_async(get_job_details_lite(job_id))
+
+
+@st.fragment
+def render_job_history(session_token: str) -> None:
+    """Render the sidebar list of past jobs for the session"""
+    # Tokens are minted per browser session, so no jobs can exist until this
+    # session submits one - skip the DB entirely for the empty state
+    if st.session_state.get("has_jobs"):
+        jobs = get_session_jobs_cached(session_token)
+    else:
+        jobs = []
+    
+    if not jobs:
+        st.info("No previous analyses. Submit your first idea!")
+        return
+    
+    for job in jobs:
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            if st.button(
+                f"{job['original_idea'][:30]}...",
+                key=f"job_{job['id']}",
+                use_container_width=True,
+            ):
+                st.session_state.selected_job_id = job["id"]
+                st.session_state.show_results = True
+                # Clicks only rerun this fragment; the results view needs the full page
+                st.rerun()
+        with col2:
+            st.markdown(render_status_badge(job["status"]))
+
+
+@st.fragment
 def render_thought_trace(job_details: dict[str, Any]) -> None:
     """Render the thought trace, debate transcript, and pivot history expander"""
     
@@ -110,8 +268,8 @@ def render_thought_trace(job_details: dict[str, Any]) -> None:
             st.info("No execution history available yet.")
             return
         
-        # Timeline of steps
-        st.markdown("### Execution Timeline")
+        # Timeline of steps, rendered as one markdown element
+        lines = ["### Execution Timeline"]
         
         for step in steps:
             node_name = step["node_name"]
@@ -120,40 +278,33 @@ def render_thought_trace(job_details: dict[str, Any]) -> None:
             pivot_num = step.get("pivot_attempt", 0)
             
             # Icon based on node
-            icons = {
-                "input_validator": "🛡️",
-                "market_researcher": "🔍",
-                "competitor_analyst": "📊",
-                "debate_panel": "⚔️",
-                "devils_advocate": "😈",
-                "apply_pivot": "🔄",
-                "writer": "✍️",
-                "handle_invalid": "⚠️",
-            }
-            icon = icons.get(node_name, "⚙️")
+            icon = _NODE_ICONS.get(node_name, "⚙️")
             
             # Format
             if error:
-                st.error(f"{icon} **{node_name}** (Pivot #{pivot_num}) - ❌ Failed: {error}")
+                lines.append(f"{icon} **{node_name}** (Pivot #{pivot_num}) - ❌ :red[Failed: {error}]")
             else:
-                st.success(f"{icon} **{node_name}** (Pivot #{pivot_num}) - ✅ {duration}ms")
+                lines.append(f"{icon} **{node_name}** (Pivot #{pivot_num}) - ✅ :green[{duration}ms]")
+        
+        st.markdown("\n\n".join(lines))
         
         # Check for debate result and show transcript
         _render_debate_transcript(job_details)
         
         # Pivot history
         if pivots:
-            st.markdown("### Pivot Decisions")
-            
+            blocks = ["### Pivot Decisions"]
             for pivot in pivots:
-                st.markdown(f"""
-**Pivot #{pivot['attempt_num']}** (Score: {pivot['score']}/10)
+                blocks.append(f"""**Pivot #{pivot['attempt_num']}** (Score: {pivot['score']}/10)
 
 - **Before:** {pivot['original_idea']}
 - **After:** {pivot['suggested_pivot']}
 - **Reason:** {pivot['reason']}
----
-""")
+
+---""")
+            
+            # Single markdown element for all pivots
+            st.markdown("\n\n".join(blocks))
 
 
 def _render_debate_transcript(job_details: dict[str, Any]) -> None:
@@ -200,39 +351,30 @@ def _render_debate_transcript(job_details: dict[str, Any]) -> None:
     # Show full transcript in a sub-expander
     if debate_transcript:
         with st.expander("📜 Full Debate Transcript", expanded=False):
+            entries = []
+            icons_get = _SPEAKER_ICONS.get
             for msg in debate_transcript:
                 speaker = msg.get("speaker", "Unknown")
                 content = msg.get("content", "")
+                icon = icons_get(speaker, "💬")
                 
-                icons = {"Bull": "🐂", "Bear": "🐻", "Synthesizer": "⚖️"}
-                icon = icons.get(speaker, "💬")
-                
-                st.markdown(f"**{icon} {speaker}:**")
-                st.markdown(content)
-                st.markdown("---")
+                entries.append(f"**{icon} {speaker}:**\n\n{content}\n\n---")
+            
+            # Single markdown element for the whole transcript
+            st.markdown("\n\n".join(entries))
 
 
 def render_status_badge(status: str) -> str:
     """Return a colored status badge"""
-    colors = {
-        "pending": "🟡",
-        "running": "🔵",
-        "validating": "🛡️",
-        "validated": "✅",
-        "invalid_input": "⚠️",
-        "researching": "🔍",
-        "debating": "⚔️",
-        "writing": "✍️",
-        "completed": "🟢",
-        "failed": "🔴",
-    }
     # Format status for display
     display_status = status.replace("_", " ").capitalize()
-    return f"{colors.get(status, '⚪')} {display_status}"
+    return f"{_STATUS_COLORS.get(status, '⚪')} {display_status}"
 
 
 def format_timestamp(dt: datetime | None) -> str:
     """Format a timestamp for display"""
     if dt is None:
         return "N/A"
-    return dt.strftime("%Y-%m-%d %H:%M:%S")
+    # Same output as strftime("%Y-%m-%d %H:%M:%S") without parsing a format
+    # string; dropping tzinfo keeps the "+00:00" suffix off aware datetimes
+    return dt.replace(tzinfo=None).isoformat(sep=" ", timespec="seconds")
@@ -1,7 +1,8 @@
 """Tests for the LangGraph state machine logic"""
 
 import pytest
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 from src.graph.state import (
     AgentState,
@@ -64,12 +65,15 @@ class TestAgentState:
 class TestConditionalEdges:
     """Tests for conditional edge logic"""
     
-    @patch("src.graph.edges.get_settings")
-    def test_should_proceed_to_writer_on_high_score(self, mock_settings):
+    @pytest.fixture(autouse=True)
+    def _settings(self, monkeypatch):
+        """Patch edge settings once for every test in the class"""
+        settings = SimpleNamespace(pivot_threshold=5, max_pivot_attempts=3)
+        monkeypatch.setattr("src.graph.edges.get_settings", lambda: settings)
+        return settings
+    
+    def test_should_proceed_to_writer_on_high_score(self):
         """Test that high scores proceed to writer"""
-        mock_settings.return_value.pivot_threshold = 5
-        mock_settings.return_value.max_pivot_attempts = 3
-        
         state: AgentState = {
             "devils_advocate_feedback": {"score": 7},
             "pivot_attempts": 0,
@@ -78,12 +82,8 @@ class TestConditionalEdges:
         result = should_pivot_or_proceed(state)
         assert result == "write_success"
     
-    @patch("src.graph.edges.get_settings")
-    def test_should_pivot_on_low_score_with_attempts_remaining(self, mock_settings):
+    def test_should_pivot_on_low_score_with_attempts_remaining(self):
         """Test that low scores trigger pivot when attempts remain"""
-        mock_settings.return_value.pivot_threshold = 5
-        mock_settings.return_value.max_pivot_attempts = 3
-        
         state: AgentState = {
             "devils_advocate_feedback": {"score": 4},
             "pivot_attempts": 1,
@@ -92,12 +92,8 @@ class TestConditionalEdges:
         result = should_pivot_or_proceed(state)
         assert result == "pivot"
     
-    @patch("src.graph.edges.get_settings")
-    def test_should_write_failure_when_pivots_exhausted(self, mock_settings):
+    def test_should_write_failure_when_pivots_exhausted(self):
         """Test that exhausted pivots lead to market reality report"""
-        mock_settings.return_value.pivot_threshold = 5
-        mock_settings.return_value.max_pivot_attempts = 3
-        
         state: AgentState = {
             "devils_advocate_feedback": {"score": 3},
             "pivot_attempts": 3,
@@ -106,12 +102,8 @@ class TestConditionalEdges:
         result = should_pivot_or_proceed(state)
         assert result == "write_failure"
     
-    @patch("src.graph.edges.get_settings")
-    def test_apply_pivot_updates_state(self, mock_settings):
+    def test_apply_pivot_updates_state(self):
         """Test that apply_pivot correctly updates state"""
-        mock_settings.return_value.pivot_threshold = 5
-        mock_settings.return_value.max_pivot_attempts = 3
-        
         state: AgentState = {
             "current_idea": "Generic todo app",
             "pivot_attempts": 1,
@@ -318,7 +310,7 @@ class TestDebateFunctionality:
     @patch("src.graph.edges.get_settings")
     def test_should_proceed_after_debate_success(self, mock_settings):
         """Test proceeding after successful debate with high score"""
-        mock_settings.return_value.pass_threshold = 5
+        mock_settings.return_value = SimpleNamespace(pass_threshold=5)
         
         state: AgentState = {
             "debate_result": {
@@ -334,7 +326,7 @@ class TestDebateFunctionality:
     @patch("src.graph.edges.get_settings")
     def test_should_proceed_after_debate_failure(self, mock_settings):
         """Test write_failure when debate score is too low"""
-        mock_settings.return_value.pass_threshold = 5
+        mock_settings.return_value = SimpleNamespace(pass_threshold=5)
         
         state: AgentState = {
             "debate_result": {
@@ -350,7 +342,7 @@ class TestDebateFunctionality:
     @patch("src.graph.edges.get_settings")
     def test_should_proceed_after_debate_missing(self, mock_settings):
         """Test fallback when debate result is missing"""
-        mock_settings.return_value.pass_threshold = 5
+        mock_settings.return_value = SimpleNamespace(pass_threshold=5)
         
         state: AgentState = {}
         